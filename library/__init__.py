@@ -1,13 +1,37 @@
 """CANFAR Science Platform Container Library"""
 
+from functools import lru_cache
 from pathlib import Path
 
-HADOLINT_CONFIG_PATH = Path(__file__).resolve().parent / ".hadolint.yaml"
-RENOVATE_CONFIG_PATH = Path(__file__).resolve().parent / "renovate.json5"
-TRIVY_CONFIG_PATH = Path(__file__).resolve().parent / ".trivy.yaml"
 DEFAULT_LIBRARY_MANIFEST_FILENAME = ".library.manifest.yaml"
 ALLOWED_GIT_SOURCES: list[str] = ["github.com", "gitlab.com"]
 
+_PACKAGED_CONFIG_FILENAMES: dict[str, str] = {
+    "HADOLINT_CONFIG_PATH": ".hadolint.yaml",
+    "RENOVATE_CONFIG_PATH": "renovate.json5",
+    "TRIVY_CONFIG_PATH": ".trivy.yaml",
+}
+
+
+@lru_cache(maxsize=1)
+def _package_dir() -> Path:
+    """Return the package directory, resolving only when __file__ is relative."""
+    location = Path(__file__)
+    if not location.is_absolute():  # pragma: no cover - unusual import setups only
+        location = location.resolve()
+    return location.parent
+
+
+def __getattr__(name: str) -> Path:
+    """Compute packaged config path constants lazily on first access (PEP 562)."""
+    filename = _PACKAGED_CONFIG_FILENAMES.get(name)
+    if filename is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    path = _package_dir() / filename
+    globals()[name] = path
+    return path
+
+
 __all__ = [
     "HADOLINT_CONFIG_PATH",
     "RENOVATE_CONFIG_PATH",
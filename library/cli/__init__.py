@@ -2,6 +2,21 @@
 
 from __future__ import annotations
 
+from importlib import import_module
+from types import ModuleType
+
+_SUBMODULES = {"build", "dispatch", "helpers", "init", "main"}
+
+
+def __getattr__(name: str) -> ModuleType:
+    """Import CLI submodules lazily on first attribute access (PEP 562)."""
+    if name in _SUBMODULES:
+        module = import_module(f"library.cli.{name}")
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "build",
     "dispatch",
@@ -2,20 +2,33 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-import json
+import os
+import sys
+import threading
 
 from library import schema
 from library.cli import build
+from library.cli import helpers
 from library.parsers import get as get_parser
+from library.parsers import hadolint as hadolint_parser
 from library.tools import defaults as runtime_defaults
+from library.tools import native as tool_native
 from library.tools import ToolRunContext, ToolRunResult, run as run_tool
 from library.tools import resolve as tool_resolve
 from library.utils import docker
 from library.utils.console import console
 
+_UTC = timezone.utc
+
+# Concurrent dispatches must not interleave report rows from different
+# manifests; reporting is serialized under this lock.
+_REPORT_LOCK = threading.Lock()
+
 
 @dataclass(slots=True)
 class ToolDispatchResult:
@@ -28,23 +41,63 @@ class ToolDispatchResult:
     result: ToolRunResult
 
 
-def _ensure_artifacts(parser: str, output_dir: Path, stdout: str) -> None:
-    """Ensure expected artifacts exist for parsers that can emit stdout only."""
-    if parser == "hadolint":
-        if any(output_dir.glob("*.json")):
-            return
-        if not stdout.strip():
-            raise ValueError("Hadolint produced no JSON stdout or output artifacts.")
-        artifact_path = output_dir / "hadolint.json"
-        artifact_path.write_text(stdout.strip(), encoding="utf-8")
-        return
-    if parser == "renovate":
-        if any(output_dir.iterdir()):
-            return
-        if not stdout.strip():
-            raise ValueError("Refurbish produced no output artifacts.")
-        artifact_path = output_dir / "refurbish.log"
-        artifact_path.write_text(stdout.strip(), encoding="utf-8")
+def _has_json_artifact(output_dir: Path) -> bool:
+    """Check for a *.json artifact without per-entry Path allocation."""
+    with os.scandir(output_dir) as entries:
+        return any(
+            entry.name.endswith(".json") and entry.is_file(follow_symlinks=False)
+            for entry in entries
+        )
+
+
+def _has_any_artifact(output_dir: Path) -> bool:
+    """Check whether the output directory contains any entry at all."""
+    with os.scandir(output_dir) as entries:
+        return next(iter(entries), None) is not None
+
+
+@dataclass(slots=True, frozen=True)
+class _ArtifactRule:
+    """Stdout-fallback artifact rule for a parser."""
+
+    exists: Callable[[Path], bool]
+    filename: str
+    missing_error: str
+    from_text: Callable[[str], object] | None = None
+
+
+_ARTIFACT_RULES: dict[str, _ArtifactRule] = {
+    "hadolint": _ArtifactRule(
+        exists=_has_json_artifact,
+        filename="hadolint.json",
+        missing_error="Hadolint produced no JSON stdout or output artifacts.",
+        from_text=hadolint_parser.from_text,
+    ),
+    "renovate": _ArtifactRule(
+        exists=_has_any_artifact,
+        filename="refurbish.log",
+        missing_error="Refurbish produced no output artifacts.",
+    ),
+}
+
+
+def _ensure_artifacts(parser: str, output_dir: Path, stdout: str) -> object | None:
+    """Ensure expected artifacts exist for parsers that can emit stdout only.
+
+    Returns:
+        The payload parsed directly from stdout when the artifact had to be
+        materialized from it, otherwise None.
+    """
+    rule = _ARTIFACT_RULES.get(parser)
+    if rule is None or rule.exists(output_dir):
+        return None
+    text = stdout.strip()
+    if not text:
+        raise ValueError(rule.missing_error)
+    (output_dir / rule.filename).write_text(text, encoding="utf-8")
+    # stdout is already in memory; parse it once instead of re-reading the
+    # artifact that was just written.
+    return rule.from_text(text) if rule.from_text is not None else None
 
 
 def _default_image_reference(command: str) -> str:
@@ -62,28 +115,33 @@ def _run_resolved_tool_command(
     output_root: Path | None = None,
 ) -> ToolDispatchResult:
     """Execute a pre-resolved tool and parse/report its outputs."""
-    docker.pull(tool.image, quiet=not verbose)
-    console.print(f"[cyan]Running {tool.parser}...[/cyan]")
+    if not tool_native.available(tool):
+        docker.pull(tool.image, quiet=not verbose)
+    target = f" for {manifest}" if manifest is not None else ""
+    console.print(f"[cyan]Running {tool.parser}{target}...[/cyan]")
 
     result = run_tool(
         ToolRunContext(
             manifest=manifest,
             command=command,
             image=image,
-            time=datetime.now(timezone.utc),
+            time=datetime.now(_UTC),
             tool=tool,
             output_root=output_root,
         )
     )
-    _ensure_artifacts(tool.parser, Path(result.output), result.stdout)
+    payload = _ensure_artifacts(tool.parser, Path(result.output), result.stdout)
 
     parser = get_parser(tool.parser)
-    payload = parser.parse(Path(result.output))
-    parser.report(payload)
-    if verbose and result.stdout:
-        print(result.stdout, end="")
-    if result.stderr:
-        print(result.stderr, end="")
+    if payload is None:
+        payload = parser.parse(Path(result.output))
+    with _REPORT_LOCK:
+        parser.report(payload)
+        if verbose and result.stdout:
+            sys.stdout.write(result.stdout)
+        if result.stderr:
+            # Tool stderr is part of the command's stdout report, as before.
+            sys.stdout.write(result.stderr)
     return ToolDispatchResult(
         command=command,
         tool_id=tool.id,
@@ -112,6 +170,37 @@ def run_tool_command(
     )
 
 
+def run_tool_commands(
+    command: str,
+    *,
+    manifests: Sequence[Path],
+    image: str | None,
+    verbose: bool,
+) -> list[ToolDispatchResult]:
+    """Run a tool-backed command per manifest, concurrently when several.
+
+    Tool runs are dominated by container and network I/O, so threads
+    overlap them; results keep manifest order and the single-manifest
+    path stays synchronous.
+    """
+    if len(manifests) == 1:
+        return [
+            run_tool_command(
+                command, manifest=manifests[0], image=image, verbose=verbose
+            )
+        ]
+    workers = min(len(manifests), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(
+            pool.map(
+                lambda manifest: run_tool_command(
+                    command, manifest=manifest, image=image, verbose=verbose
+                ),
+                manifests,
+            )
+        )
+
+
 def _manifest_scan_image_reference(manifest_model: schema.Schema) -> str:
     """Build a default scan image reference from manifest registry and first tag."""
     tag = manifest_model.build.tags[0]
@@ -149,10 +238,11 @@ def run_scan_command(
             "Pass IMAGE or create a manifest with `library init`."
         )
 
-    fallback_tool = runtime_defaults.DEFAULT_TRIVY_TOOL.model_copy(deep=True)
+    # The runner treats tool definitions as read-only, so the shared
+    # module-level default is safe to dispatch without a deep copy.
     return _run_resolved_tool_command(
         "scan",
-        tool=fallback_tool,
+        tool=runtime_defaults.DEFAULT_TRIVY_TOOL,
         manifest=None,
         image=image,
         verbose=verbose,
@@ -174,4 +264,4 @@ def run_build(path: Path, extra_args: list[str]) -> int:
 def emit_refurbish_payload(payload: object, *, json_output: bool) -> None:
     """Emit optional JSON for refurbish command output payload."""
     if json_output:
-        console.print_json(json.dumps(payload))
+        helpers.print_json_output(payload)
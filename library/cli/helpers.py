@@ -3,11 +3,31 @@
 from __future__ import annotations
 
 import json
+import os
+import shutil
+import sys
 from pathlib import Path
 
 from library import schema
+from library.tools import defaults as runtime_defaults
 from library.utils.console import console
 
+try:  # Optional C-accelerated serializer for large payloads.
+    import orjson  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None  # type: ignore[assignment]
+
+
+def _write_bytes_direct(path: Path, payload: bytes) -> None:
+    """Write a whole file with one open/write/close, skipping buffered IO."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
 
 def read_dockerfile(dockerfile_path: Path) -> str:
     """Read Dockerfile contents from disk.
@@ -19,7 +39,7 @@ def read_dockerfile(dockerfile_path: Path) -> str:
         Dockerfile contents as text.
     """
     console.print(f"[cyan]Reading Dockerfile: {dockerfile_path}[/cyan]")
-    return dockerfile_path.read_text(encoding="utf-8")
+    return dockerfile_path.read_bytes().decode("utf-8")
 
 
 def load_manifest(manifest_path: Path) -> schema.Schema:
@@ -55,11 +75,10 @@ def resolve_dockerfile_contents(
     if manifest_path is None:
         raise ValueError("Either manifest_path or dockerfile_path must be provided")
 
-    manifest_model = load_manifest(manifest_path)
-    dockerfile = Path(manifest_model.build.file)
-    if not dockerfile.is_absolute():
-        dockerfile = manifest_path.parent / manifest_model.build.context / dockerfile
-    dockerfile_contents = read_dockerfile(dockerfile.resolve())
+    # The build section is all that is needed here; the raw-data resolver
+    # skips building and validating the full manifest model.
+    dockerfile = runtime_defaults.manifest_dockerfile(manifest_path)
+    dockerfile_contents = read_dockerfile(dockerfile)
     console.print("[cyan]Resolved Dockerfile Contents:[/cyan]")
     console.print(f"\n{dockerfile_contents}\n")
     return dockerfile_contents
@@ -85,8 +104,9 @@ def prepare_workspace(
     dockerfile_path = temp_path / "Dockerfile"
     config_path = temp_path / config_name
     console.print(f"[cyan]Preparing {label} workspace...[/cyan]")
-    dockerfile_path.write_text(dockerfile_contents, encoding="utf-8")
-    config_path.write_text(config_source.read_text(encoding="utf-8"), encoding="utf-8")
+    _write_bytes_direct(dockerfile_path, dockerfile_contents.encode("utf-8"))
+    # copyfile uses sendfile on Linux - the config never enters userspace.
+    shutil.copyfile(config_source, config_path)
 
 
 def parse_json_output(output: str) -> object:
@@ -101,10 +121,33 @@ def parse_json_output(output: str) -> object:
     return json.loads(output)
 
 
+def dump_json(payload: object) -> str:
+    """Serialize a payload to indented JSON, preferring orjson when present.
+
+    Args:
+        payload: Parsed JSON payload.
+
+    Returns:
+        Indented JSON text.
+    """
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode()
+    # ensure_ascii=False matches orjson's raw UTF-8 output, so --json
+    # emission does not depend on which serializer is installed.
+    return json.dumps(payload, indent=2, ensure_ascii=False)
+
+
 def print_json_output(payload: object) -> None:
     """Print JSON payload with formatting.
 
     Args:
         payload: Parsed JSON payload.
     """
-    console.print_json(json.dumps(payload, indent=2))
+    if console.is_terminal:
+        # Hand Rich the parsed object directly; pre-dumping would make it
+        # re-parse the string before pretty-printing.
+        console.print_json(data=payload)
+        return
+    # Pipes and CI logs skip Rich's highlighter for multi-MB reports.
+    sys.stdout.write(dump_json(payload))
+    sys.stdout.write("\n")
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 from pathlib import Path
+import os
+import stat
 import subprocess
 
 from pydantic import BaseModel, ConfigDict
@@ -24,8 +26,83 @@ class InitForm(BaseModel):
     model_config = ConfigDict(extra="forbid", validate_assignment=True)
 
 
+def _git_dir(start: Path) -> Path | None:
+    """Locate the git directory for a path, following worktree redirects."""
+    for candidate in (start, *start.parents):
+        git_path = candidate / ".git"
+        if git_path.is_dir():
+            return git_path
+        if git_path.is_file():
+            try:
+                content = git_path.read_text(encoding="utf-8").strip()
+            except OSError:
+                return None
+            if content.startswith("gitdir: "):
+                target = Path(content[len("gitdir: ") :])
+                return target if target.is_absolute() else candidate / target
+            return None
+    return None
+
+
+def _common_git_dir(git_dir: Path) -> Path | None:
+    """Return the shared git dir for a linked worktree, if any."""
+    try:
+        commondir = (git_dir / "commondir").read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+    common = Path(commondir)
+    return common if common.is_absolute() else git_dir / common
+
+
+def _read_ref(ref: str, candidates: list[Path]) -> str | None:
+    """Resolve a ref against candidate git dirs, including packed refs."""
+    for git_dir in candidates:
+        try:
+            revision = (git_dir / ref).read_text(encoding="utf-8").strip()
+        except OSError:
+            continue
+        if revision:
+            return revision
+    # Freshly packed repositories keep branch tips in packed-refs only.
+    for git_dir in candidates:
+        try:
+            packed = (git_dir / "packed-refs").read_text(encoding="utf-8")
+        except OSError:
+            continue
+        for line in packed.splitlines():
+            if line.startswith(("#", "^")):
+                continue
+            parts = line.split(" ", 1)
+            if len(parts) == 2 and parts[1].strip() == ref:
+                return parts[0]
+    return None
+
+
+def _read_git_head(git_dir: Path) -> str | None:
+    """Read the HEAD commit from a git directory without spawning git."""
+    try:
+        head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+    if not head.startswith("ref: "):
+        return head or None
+    ref = head[len("ref: ") :]
+    candidates = [git_dir]
+    common = _common_git_dir(git_dir)
+    if common is not None:
+        # Linked worktrees keep branch refs and packed-refs in the common
+        # git dir, not under .git/worktrees/<name>/.
+        candidates.append(common)
+    return _read_ref(ref, candidates)
+
+
 def _current_revision() -> str:
     """Return git HEAD revision, or 'unknown' if unavailable."""
+    git_dir = _git_dir(Path.cwd())
+    revision = _read_git_head(git_dir) if git_dir is not None else None
+    if revision is not None:
+        return revision
+    # Layouts the file reader does not cover fall back to git itself.
     try:
         result = subprocess.run(
             ["git", "rev-parse", "HEAD"],
@@ -35,10 +112,8 @@ def _current_revision() -> str:
         )
     except OSError:
         return "unknown"
-    if result.returncode != 0:
-        return "unknown"
     revision = result.stdout.strip()
-    return revision or "unknown"
+    return revision if result.returncode == 0 and revision else "unknown"
 
 
 def _confirm_overwrite(path: Path) -> bool:
@@ -49,22 +124,33 @@ def _confirm_overwrite(path: Path) -> bool:
     )
 
 
+def collect_init_form() -> InitForm:
+    """Prompt for manifest fields with the current git revision prefilled."""
+    return fill(
+        InitForm,
+        initial={"metadata": {"discovery": {"revision": _current_revision()}}},
+        config=FormConfig(),
+    )
+
+
 def run_init(output: Path) -> None:
     """Run interactive manifest initialization and save the result."""
     output_path = output.expanduser().resolve()
 
-    if output_path.exists():
-        if not output_path.is_file():
+    # One stat answers both the exists and the is-file question.
+    try:
+        mode = os.stat(output_path).st_mode
+    except FileNotFoundError:
+        mode = None
+    if mode is not None:
+        if not stat.S_ISREG(mode):
             raise ValueError(f"Output path exists and is not a file: {output_path}")
         if not _confirm_overwrite(output_path):
             console.print(f"[yellow]ℹ️ Manifest left unchanged: {output_path}[/yellow]")
             return
 
     try:
-        form = fill(
-            InitForm,
-            config=FormConfig(),
-        )
+        form = collect_init_form()
     except KeyboardInterrupt as exc:
         console.print("[yellow]⚠️ Init canceled.[/yellow]")
         raise typer.Exit(code=130) from exc
@@ -84,5 +170,6 @@ def run_init(output: Path) -> None:
 
 __all__ = [
     "InitForm",
+    "collect_init_form",
     "run_init",
 ]
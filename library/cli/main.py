@@ -3,16 +3,40 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Any
 
-import json
 import typer
 
 from library import DEFAULT_LIBRARY_MANIFEST_FILENAME
-from library.cli import dispatch
-from library.cli import init as cli_init
 from library.utils.console import console
 
 
+def __getattr__(name: str) -> Any:
+    """Resolve heavy collaborator modules lazily (PEP 562).
+
+    --help and completion never touch dispatch (pydantic, yaml, docker)
+    or cli_init (richforms); deferring their import keeps cold start to
+    typer alone. Command bodies import the same modules, so patched
+    attributes on them stay visible.
+    """
+    if name == "dispatch":
+        from library.cli import dispatch
+
+        globals()[name] = dispatch
+        return dispatch
+    if name == "cli_init":
+        from library.cli import init as cli_init
+
+        globals()[name] = cli_init
+        return cli_init
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _first_failure(dispatched: list[Any]) -> int:
+    """Return the first non-zero dispatch exit code, or 0 when all passed."""
+    return next((d.result.exit_code for d in dispatched if d.result.exit_code), 0)
+
+
 def callback(ctx: typer.Context) -> None:
     """Handle the top-level CLI callback.
 
@@ -39,37 +63,84 @@ cli: typer.Typer = typer.Typer(
     invoke_without_command=True,  # Allow callback to be called without subcommand
 )
 
+# Shared parameter objects, built once at import instead of per command.
+_DEFAULT_MANIFEST_PATH = Path(DEFAULT_LIBRARY_MANIFEST_FILENAME)
+
+_MANIFESTS_OPTION = typer.Option(
+    [_DEFAULT_MANIFEST_PATH],
+    "--manifest",
+    "-m",
+    help="Path to library manifest file. Repeat to process several.",
+    exists=True,
+    readable=True,
+    file_okay=True,
+    dir_okay=False,
+    resolve_path=True,
+)
+
+_SCAN_MANIFEST_OPTION = typer.Option(
+    _DEFAULT_MANIFEST_PATH,
+    "--manifest",
+    "-m",
+    help="Path to library manifest file.",
+    file_okay=True,
+    dir_okay=False,
+    resolve_path=True,
+)
+
+_BUILD_MANIFEST_OPTION = typer.Option(
+    _DEFAULT_MANIFEST_PATH,
+    "--manifest",
+    "-m",
+    help="Path to library manifest file.",
+    exists=True,
+    readable=True,
+    file_okay=True,
+    dir_okay=False,
+    resolve_path=True,
+)
+
+_OUTPUT_OPTION = typer.Option(
+    _DEFAULT_MANIFEST_PATH,
+    "--output",
+    "-o",
+    help="Output path for the manifest file.",
+    file_okay=True,
+    dir_okay=False,
+    writable=True,
+    resolve_path=True,
+)
+
+_VERBOSE_OPTION = typer.Option(False, "--verbose", "-v", help="Enable verbose output.")
+
+_JSON_OPTION = typer.Option(False, "--json", help="Emit raw JSON updates summary.")
+
+_IMAGE_ARGUMENT = typer.Argument(
+    None,
+    help="Docker image to scan. If omitted, derive from manifest defaults.",
+)
+
 
 @cli.command("lint", help="Check Dockerfile for best practices.")
 def linter(
-    manifest: Path = typer.Option(
-        Path(DEFAULT_LIBRARY_MANIFEST_FILENAME),
-        "--manifest",
-        "-m",
-        help=("Path to library manifest file."),
-        exists=True,
-        readable=True,
-        file_okay=True,
-        dir_okay=False,
-        resolve_path=True,
-    ),
-    verbose: bool = typer.Option(
-        False, "--verbose", "-v", help="Enable verbose output."
-    ),
+    manifests: list[Path] = _MANIFESTS_OPTION,
+    verbose: bool = _VERBOSE_OPTION,
 ) -> None:
-    """Run hadolint against Dockerfile resolved from a manifest.
+    """Run hadolint against Dockerfiles resolved from manifests.
 
     Args:
-        manifest: Path to the manifest file.
+        manifests: Paths to the manifest files.
         verbose: Whether to emit verbose output.
     """
-    dispatched = dispatch.run_tool_command(
+    from library.cli import dispatch
+
+    dispatched = dispatch.run_tool_commands(
         "lint",
-        manifest=manifest,
+        manifests=manifests,
         image=None,
         verbose=verbose,
     )
-    exit_code = dispatched.result.exit_code
+    exit_code = _first_failure(dispatched)
     if exit_code == 0:
         console.print("[green]✅ Hadolint completed successfully.[/green]")
     else:
@@ -78,40 +149,18 @@ def linter(
 
 
 @cli.command("init", help="Create a manifest interactively.")
-def initializer(
-    output: Path = typer.Option(
-        Path(DEFAULT_LIBRARY_MANIFEST_FILENAME),
-        "--output",
-        "-o",
-        help="Output path for the manifest file.",
-        file_okay=True,
-        dir_okay=False,
-        writable=True,
-        resolve_path=True,
-    ),
-) -> None:
+def initializer(output: Path = _OUTPUT_OPTION) -> None:
     """Collect and save a fully materialized manifest."""
+    from library.cli import init as cli_init
+
     cli_init.run_init(output)
 
 
 @cli.command("scan", help="Check Container Image for CVEs.")
 def scanner(
-    image: str | None = typer.Argument(
-        None,
-        help="Docker image to scan. If omitted, derive from manifest defaults.",
-    ),
-    manifest: Path = typer.Option(
-        Path(DEFAULT_LIBRARY_MANIFEST_FILENAME),
-        "--manifest",
-        "-m",
-        help=("Path to library manifest file."),
-        file_okay=True,
-        dir_okay=False,
-        resolve_path=True,
-    ),
-    verbose: bool = typer.Option(
-        False, "--verbose", "-v", help="Enable verbose output."
-    ),
+    image: str | None = _IMAGE_ARGUMENT,
+    manifest: Path = _SCAN_MANIFEST_OPTION,
+    verbose: bool = _VERBOSE_OPTION,
 ) -> None:
     """Run Trivy against a Docker image.
 
@@ -120,6 +169,8 @@ def scanner(
         manifest: Path to optional manifest file.
         verbose: Whether to emit verbose output.
     """
+    from library.cli import dispatch
+
     try:
         dispatched = dispatch.run_scan_command(
             manifest=manifest,
@@ -135,40 +186,33 @@ def scanner(
 
 @cli.command("refurbish", help="Find outdated dependencies.")
 def refurbisher(
-    manifest: Path = typer.Option(
-        Path(DEFAULT_LIBRARY_MANIFEST_FILENAME),
-        "--manifest",
-        "-m",
-        help=("Path to library manifest file."),
-        exists=True,
-        readable=True,
-        file_okay=True,
-        dir_okay=False,
-        resolve_path=True,
-    ),
-    verbose: bool = typer.Option(
-        False, "--verbose", "-v", help="Enable verbose output."
-    ),
-    jsonify: bool = typer.Option(
-        False, "--json", help="Emit raw JSON updates summary."
-    ),
+    manifests: list[Path] = _MANIFESTS_OPTION,
+    verbose: bool = _VERBOSE_OPTION,
+    jsonify: bool = _JSON_OPTION,
 ) -> None:
-    """Run refurbish against a manifest.
+    """Run refurbish against manifests.
 
     Args:
-        manifest: Path to the manifest.
+        manifests: Paths to the manifest files.
         verbose: Whether to emit verbose output.
-        json_output: Whether to emit JSON output.
+        jsonify: Whether to emit JSON output.
     """
-    dispatched = dispatch.run_tool_command(
+    from library.cli import dispatch
+
+    dispatched = dispatch.run_tool_commands(
         "refurbish",
-        manifest=manifest,
+        manifests=manifests,
         image=None,
         verbose=verbose,
     )
     if jsonify:
-        console.print_json(json.dumps(dispatched.payload))
-    raise typer.Exit(dispatched.result.exit_code)
+        payload = (
+            dispatched[0].payload
+            if len(dispatched) == 1
+            else [d.payload for d in dispatched]
+        )
+        dispatch.emit_refurbish_payload(payload, json_output=True)
+    raise typer.Exit(_first_failure(dispatched))
 
 
 @cli.command("validate", help="Check manifest for compliance.")
@@ -178,6 +222,8 @@ def validator(path: Path) -> None:
     Args:
         path: Path to the manifest to validate.
     """
+    from library.cli import dispatch
+
     dispatch.run_validate(path)
 
 
@@ -188,17 +234,7 @@ def validator(path: Path) -> None:
 )
 def builder(
     ctx: typer.Context,
-    manifest: Path = typer.Option(
-        Path(DEFAULT_LIBRARY_MANIFEST_FILENAME),
-        "--manifest",
-        "-m",
-        help=("Path to library manifest file."),
-        exists=True,
-        readable=True,
-        file_okay=True,
-        dir_okay=False,
-        resolve_path=True,
-    ),
+    manifest: Path = _BUILD_MANIFEST_OPTION,
 ) -> None:
     """Build a container image using the manifest defaults.
 
@@ -206,6 +242,8 @@ def builder(
         ctx: Typer context for extra args.
         manifest: Path to the manifest file.
     """
+    from library.cli import dispatch
+
     exit_code = dispatch.run_build(manifest, list(ctx.args))
     raise typer.Exit(exit_code)
 
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 from library.parsers import hadolint, refurbish, trivy
@@ -18,18 +19,24 @@ class ParserAdapter:
     report: Callable[[Any], int]
 
 
-def registry() -> dict[str, ParserAdapter]:
-    """Return built-in parser registry keyed by tool parser name."""
-    return {
+# Built once; adapters are frozen dataclasses, so sharing them is safe.
+_REGISTRY: Mapping[str, ParserAdapter] = MappingProxyType(
+    {
         "hadolint": ParserAdapter(parse=hadolint.parse, report=hadolint.report),
         "trivy": ParserAdapter(parse=trivy.parse, report=trivy.report),
         "renovate": ParserAdapter(parse=refurbish.parse, report=refurbish.report),
     }
+)
+
+
+def registry() -> Mapping[str, ParserAdapter]:
+    """Return built-in parser registry keyed by tool parser name."""
+    return _REGISTRY
 
 
 def get(parser: str) -> ParserAdapter:
     """Resolve parser adapter by parser key."""
-    adapter = registry().get(parser)
+    adapter = _REGISTRY.get(parser)
     if adapter is None:
         raise ValueError(f"Unknown parser: {parser}")
     return adapter
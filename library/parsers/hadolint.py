@@ -4,25 +4,42 @@ from __future__ import annotations
 
 from pathlib import Path
 import json
+import os
 
 from library.cli import helpers
 from library.utils.console import console
 
 
+def _collect_violations(payload: object, origin: str) -> list[dict[str, object]]:
+    """Validate a hadolint payload and collect its violation entries."""
+    if not isinstance(payload, list):
+        raise ValueError(f"Invalid hadolint payload in {origin}")
+    return [violation for violation in payload if isinstance(violation, dict)]
+
+
+def from_text(text: str) -> list[dict[str, object]]:
+    """Parse hadolint JSON stdout into a violations list."""
+    return _collect_violations(json.loads(text), "hadolint stdout")
+
+
 def parse(output: Path) -> list[dict[str, object]]:
     """Parse hadolint JSON artifacts from a tool output directory."""
-    artifacts = sorted(output.glob("*.json"))
+    # scandir returns entries with cached type info in one getdents batch,
+    # instead of fnmatch plus a stat per candidate.
+    with os.scandir(output) as entries:
+        artifacts = sorted(
+            entry.path
+            for entry in entries
+            if entry.name.endswith(".json") and entry.is_file()
+        )
     if not artifacts:
         raise ValueError(f"No hadolint JSON artifacts found under: {output}")
 
     violations: list[dict[str, object]] = []
     for artifact in artifacts:
-        payload = json.loads(artifact.read_text(encoding="utf-8"))
-        if not isinstance(payload, list):
-            raise ValueError(f"Invalid hadolint payload in artifact: {artifact}")
-        for violation in payload:
-            if isinstance(violation, dict):
-                violations.append(violation)
+        with open(artifact, "rb") as handle:
+            payload = json.loads(handle.read())
+        violations.extend(_collect_violations(payload, f"artifact: {artifact}"))
     return violations
 
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
 
 from library.cli import helpers
@@ -11,11 +12,19 @@ from library.utils.console import console
 
 def parse(output: Path) -> dict[str, object]:
     """Parse trivy JSON artifacts from a tool output directory."""
-    artifacts = sorted(output.glob("*.json"))
+    with os.scandir(output) as entries:
+        artifacts = sorted(
+            entry.path
+            for entry in entries
+            if entry.name.endswith(".json") and entry.is_file()
+        )
     if not artifacts:
         raise ValueError(f"No trivy JSON artifacts found under: {output}")
 
-    payload = json.loads(artifacts[0].read_text(encoding="utf-8"))
+    # Multi-MB reports decode faster as bytes: json.loads handles UTF-8
+    # itself and the TextIOWrapper copy is skipped.
+    with open(artifacts[0], "rb") as handle:
+        payload = json.loads(handle.read())
     if not isinstance(payload, dict):
         raise ValueError(f"Invalid trivy payload in artifact: {artifacts[0]}")
     return payload
@@ -24,10 +33,15 @@ def parse(output: Path) -> dict[str, object]:
 def report(payload: dict[str, object]) -> int:
     """Emit trivy results and return vulnerability count."""
     helpers.print_json_output(payload)
+    results = payload.get("Results", [])
     vulnerabilities = 0
-    for item in payload.get("Results", []):
-        if isinstance(item, dict):
-            vulnerabilities += len(item.get("Vulnerabilities", []))
+    if isinstance(results, list):
+        # Counting needs only the list lengths, not another walk per result.
+        vulnerabilities = sum(
+            len(item.get("Vulnerabilities", ()))
+            for item in results
+            if isinstance(item, dict)
+        )
     if vulnerabilities:
         console.print(f"[red]Trivy vulnerabilities found: {vulnerabilities}[/red]")
     else:
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from copy import deepcopy
+import hashlib
+import json
+import os
 import re
-import shlex
 from typing import Any, Literal, cast
 
 from pydantic import (
@@ -20,17 +23,166 @@ from pydantic import (
     field_validator,
     model_validator,
 )
-from yaml import dump as yaml_dump
-from yaml import safe_load
-
 from library import DEFAULT_LIBRARY_MANIFEST_FILENAME
 
+
+@lru_cache(maxsize=1)
+def _yaml_loader() -> tuple[Any, Any]:
+    """Import yaml on first parse; returns (load, C-backed loader class)."""
+    from yaml import load
+
+    loader_cls: Any
+    try:  # libyaml is an order of magnitude faster than pure Python.
+        from yaml import CSafeLoader
+
+        loader_cls = CSafeLoader
+    except ImportError:  # pragma: no cover - depends on libyaml availability
+        from yaml import SafeLoader
+
+        loader_cls = SafeLoader
+    return load, loader_cls
+
+
+@lru_cache(maxsize=1)
+def _yaml_dumper() -> tuple[Any, Any]:
+    """Import yaml on first dump; returns (dump, C-backed dumper class)."""
+    from yaml import dump
+
+    dumper_cls: Any
+    try:
+        from yaml import CSafeDumper
+
+        dumper_cls = CSafeDumper
+    except ImportError:  # pragma: no cover - depends on libyaml availability
+        from yaml import SafeDumper
+
+        dumper_cls = SafeDumper
+    return dump, dumper_cls
+
+
 TOOL_TOKEN_PATTERN = re.compile(r"{{\s*([a-zA-Z0-9_.-]+)\s*}}")
 
+# Characters with no special meaning to shlex; options made of these split
+# identically with plain whitespace splitting.
+_PLAIN_OPTIONS_PATTERN = re.compile(r"^[A-Za-z0-9_@%+=:,./\s-]*$")
+
+
+@lru_cache(maxsize=64)
+def split_options(options: str) -> tuple[str, ...]:
+    """Tokenize buildx options, bypassing shlex for quote-free values.
+
+    Cached per distinct options string so repeat command builds skip the
+    re-parse; the tuple result keeps cache entries immutable.
+    """
+    if _PLAIN_OPTIONS_PATTERN.match(options):
+        return tuple(options.split())
+    import shlex  # Deferred: only quoted option strings need the tokenizer.
+
+    return tuple(shlex.split(options))
+
+
+def _manifest_cache_path(location: str) -> Path:
+    """Return the JSON parse-cache path for a resolved manifest path."""
+    cache_root = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    digest = hashlib.sha256(location.encode("utf-8")).hexdigest()
+    return cache_root / "canfar-library" / f"{digest}.json"
+
+
+def _read_manifest_cache(
+    location: str, mtime_ns: int, size: int
+) -> dict[str, Any] | None:
+    """Read cached manifest data, or None when stale, missing, or unreadable."""
+    try:
+        payload = json.loads(_manifest_cache_path(location).read_bytes())
+    except (OSError, ValueError):
+        return None
+    if (
+        not isinstance(payload, dict)
+        or payload.get("mtime_ns") != mtime_ns
+        or payload.get("size") != size
+    ):
+        return None
+    data = payload.get("data")
+    return data if isinstance(data, dict) else None
+
+
+def _has_string_keys(data: object) -> bool:
+    """Check that every mapping key in a payload is a string, recursively."""
+    if isinstance(data, dict):
+        return all(
+            isinstance(key, str) and _has_string_keys(value)
+            for key, value in data.items()
+        )
+    if isinstance(data, list):
+        return all(_has_string_keys(item) for item in data)
+    return True
+
+
+def _write_manifest_cache(
+    location: str, mtime_ns: int, size: int, data: dict[str, Any]
+) -> None:
+    """Persist parsed manifest data as JSON, best-effort and atomic."""
+    if not _has_string_keys(data):
+        # json.dumps silently stringifies non-string keys ({True: x} ->
+        # {"true": x}), so a cached payload could validate differently
+        # from the YAML parse; leave such payloads uncached.
+        return
+    try:
+        serialized = json.dumps(
+            {"mtime_ns": mtime_ns, "size": size, "data": data},
+            separators=(",", ":"),
+        )
+    except (TypeError, ValueError):
+        # Payloads with non-JSON scalars (e.g. YAML timestamps) stay uncached.
+        return
+    cache_path = _manifest_cache_path(location)
+    temp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path.write_text(serialized, encoding="utf-8")
+        os.replace(temp_path, cache_path)
+    except OSError:
+        return
+
+
+@lru_cache(maxsize=32)
+def _cached_manifest_data(location: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    """Parse manifest YAML, cached on path identity and stat signature."""
+    cached = _read_manifest_cache(location, mtime_ns, size)
+    if cached is not None:
+        return cached
+    yaml_load, loader_cls = _yaml_loader()
+    # Binary mode lets libyaml handle UTF-8 itself instead of routing the
+    # file through a TextIOWrapper decode first.
+    with open(location, "rb") as datafile:
+        data = yaml_load(datafile, Loader=loader_cls)
+    if data is None:
+        data = {}
+    if not isinstance(data, dict):
+        raise ValueError("Manifest must be a dictionary.")
+    _write_manifest_cache(location, mtime_ns, size, data)
+    return data
+
+
+def load_manifest_data(path: Path) -> dict[str, Any]:
+    """Load raw manifest data, reusing cached parses for unchanged files.
+
+    Args:
+        path: Resolved path to the manifest file.
+
+    Returns:
+        Parsed manifest payload. Callers must treat it as read-only.
+    """
+    stats = path.stat()
+    return _cached_manifest_data(str(path), stats.st_mtime_ns, stats.st_size)
+
+
+_UTC = timezone.utc
+
 
 def _utc_now() -> datetime:
     """Return timezone-aware current UTC timestamp."""
-    return datetime.now(timezone.utc)
+    return datetime.now(_UTC)
 
 
 def _normalize_relative_input_sources(
@@ -40,27 +192,53 @@ def _normalize_relative_input_sources(
     if base is None:
         return payload
 
-    normalized = deepcopy(payload)
-    tools = normalized.get("config", {}).get("tools", [])
+    # Nothing to rewrite without tools; skip any copying entirely.
+    config = payload.get("config")
+    if not isinstance(config, dict) or not config.get("tools"):
+        return payload
+    tools = config["tools"]
+    if not isinstance(tools, list):
+        return payload
+    base_str = str(base)
 
-    for tool in tools:
+    # Copy-on-write: only the containers on a mutated path are cloned;
+    # untouched subtrees (metadata, build, env dicts) stay shared with the
+    # caller's payload, which is treated as read-only throughout.
+    new_tools: list[Any] | None = None
+    for index, tool in enumerate(tools):
         if not isinstance(tool, dict):
             continue
         inputs = tool.get("inputs")
         if not isinstance(inputs, Mapping):
             continue
-        for input_data in inputs.values():
+        new_inputs: dict[str, Any] | None = None
+        for input_key, input_data in inputs.items():
             if not isinstance(input_data, dict):
                 continue
             source = input_data.get("source")
             if not isinstance(source, str) or source == "default":
                 continue
-            source_path = Path(source)
-            if source_path.is_absolute():
+            # Pure string-level absolute check and join; realpath's syscall
+            # chain per input is not needed to anchor a plain relative
+            # source. Sources with '..' keep resolve(): collapsing them
+            # lexically would diverge under symlinked manifest directories.
+            if os.path.isabs(source):
                 continue
-            input_data["source"] = str((base / source_path).resolve())
-
-    return normalized
+            if ".." in source:
+                rewritten = str((base / source).resolve())
+            else:
+                rewritten = os.path.normpath(os.path.join(base_str, source))
+            if new_inputs is None:
+                new_inputs = dict(inputs)
+            new_inputs[input_key] = {**input_data, "source": rewritten}
+        if new_inputs is not None:
+            if new_tools is None:
+                new_tools = list(tools)
+            new_tools[index] = {**tool, "inputs": new_inputs}
+
+    if new_tools is None:
+        return payload
+    return {**payload, "config": {**config, "tools": new_tools}}
 
 
 class Author(BaseModel):
@@ -180,22 +358,31 @@ class Build(BaseModel):
 
     model_config = ConfigDict(extra="forbid", validate_assignment=True)
 
-    def command(self) -> list[str]:
-        """Build the docker buildx command for this build."""
-        cmd = ["docker", "buildx", "build"]
+    def command(self, extra: Sequence[str] = ()) -> list[str]:
+        """Build the docker buildx command for this build.
+
+        Args:
+            extra: Pre-tokenized buildx options appended after manifest options.
+        """
         dockerfile = Path(self.file)
         if not dockerfile.is_absolute():
             dockerfile = Path(self.context) / dockerfile
-        cmd.extend(["--file", str(dockerfile)])
-        for tag in self.tags:
-            cmd.extend(["--tag", tag])
-        for platform in self.platforms:
-            cmd.extend(["--platform", platform])
-        cmd.extend(["--output", self.output])
-        if self.options:
-            cmd.extend(shlex.split(self.options))
-        cmd.append(self.context)
-        return cmd
+        # Single list literal lets CPython size the result once instead of
+        # growing it through repeated extend calls.
+        return [
+            "docker",
+            "buildx",
+            "build",
+            "--file",
+            str(dockerfile),
+            *chain.from_iterable(("--tag", tag) for tag in self.tags),
+            *chain.from_iterable(("--platform", p) for p in self.platforms),
+            "--output",
+            self.output,
+            *(split_options(self.options) if self.options else ()),
+            *extra,
+            self.context,
+        ]
 
 
 class Discovery(BaseModel):
@@ -342,6 +529,30 @@ class ToolInputs(BaseModel):
         return value
 
 
+@lru_cache(maxsize=256)
+def _check_command_tokens(command: tuple[str, ...], input_keys: frozenset[str]) -> None:
+    """Validate templated command tokens against declared input keys."""
+    findall = TOOL_TOKEN_PATTERN.findall
+    for part in command:
+        # Most command parts are plain flags; skip the regex unless a
+        # brace is present at all.
+        if "{" not in part and "}" not in part:
+            continue
+        matches = findall(part)
+        if ("{{" in part or "}}" in part) and not matches:
+            raise ValueError("Malformed template token in tool command.")
+        for token_name in matches:
+            if token_name == "image.reference":
+                continue
+            if token_name.startswith("inputs."):
+                if token_name[len("inputs.") :] not in input_keys:
+                    raise ValueError(
+                        f"Command references undefined input token: {token_name}"
+                    )
+                continue
+            raise ValueError(f"Unsupported command token: {token_name}")
+
+
 class Tool(BaseModel):
     """Definition of a Library Tool."""
 
@@ -415,22 +626,13 @@ class Tool(BaseModel):
 
     @model_validator(mode="after")
     def validate_command_tokens(self) -> "Tool":
-        """Validate supported templated tokens used in command args."""
-        for part in self.command:
-            matches = TOOL_TOKEN_PATTERN.findall(part)
-            if ("{{" in part or "}}" in part) and not matches:
-                raise ValueError("Malformed template token in tool command.")
-            for token_name in matches:
-                if token_name == "image.reference":
-                    continue
-                if token_name.startswith("inputs."):
-                    input_name = token_name.split(".", maxsplit=1)[1]
-                    if input_name not in self.inputs:
-                        raise ValueError(
-                            f"Command references undefined input token: {token_name}"
-                        )
-                    continue
-                raise ValueError(f"Unsupported command token: {token_name}")
+        """Validate supported templated tokens used in command args.
+
+        validate_assignment reruns this for every field write; the memoized
+        checker makes those reruns a cache probe unless command or inputs
+        actually changed.
+        """
+        _check_command_tokens(tuple(self.command), frozenset(self.inputs))
         return self
 
 
@@ -464,20 +666,21 @@ class Config(BaseModel):
     @model_validator(mode="after")
     def validate_catalog(self) -> "Config":
         """Validate tool id uniqueness and CLI mapping targets."""
-        tool_ids = [tool.id for tool in self.tools]
-        unique_tool_ids = set(tool_ids)
-        if len(unique_tool_ids) != len(tool_ids):
-            raise ValueError("Tool ids must be unique in config.tools.")
-
-        unknown_targets = {
-            command: tool_id
+        seen: set[str] = set()
+        for tool in self.tools:
+            tool_id = tool.id
+            if tool_id in seen:
+                raise ValueError("Tool ids must be unique in config.tools.")
+            seen.add(tool_id)
+
+        unknown_targets = [
+            (command, tool_id)
             for command, tool_id in self.cli.items()
-            if tool_id not in unique_tool_ids
-        }
+            if tool_id not in seen
+        ]
         if unknown_targets:
             missing = ", ".join(
-                f"{command}->{tool_id}"
-                for command, tool_id in sorted(unknown_targets.items())
+                f"{command}->{tool_id}" for command, tool_id in sorted(unknown_targets)
             )
             raise ValueError(f"CLI mappings reference unknown tool ids: {missing}")
         return self
@@ -535,13 +738,12 @@ class Schema(BaseModel):
     @classmethod
     def from_yaml(cls, path: Path | str) -> "Schema":
         """Load a schema model from a YAML manifest file."""
-        location = Path(path).expanduser().resolve()
-        with location.open("r", encoding="utf-8") as datafile:
-            data = safe_load(datafile)
-        if data is None:
-            data = {}
-        if not isinstance(data, dict):
-            raise ValueError("Manifest must be a dictionary.")
+        location = Path(path)
+        if not location.is_absolute():
+            # CLI paths arrive resolved (typer resolve_path=True); only
+            # normalize the ones that do not.
+            location = location.expanduser().resolve()
+        data = load_manifest_data(location)
         return cls.model_validate(
             cast(dict[str, Any], data),
             context={"base_dir": location.parent},
@@ -563,8 +765,9 @@ class Schema(BaseModel):
     def save(self, path: Path = Path.cwd() / DEFAULT_LIBRARY_MANIFEST_FILENAME) -> None:
         """Save the schema model to YAML with fully materialized defaults."""
         payload = self.model_dump(mode="json", exclude_defaults=False)
+        yaml_dump, dumper_cls = _yaml_dumper()
         with path.open("w", encoding="utf-8") as datafile:
-            yaml_dump(payload, datafile, sort_keys=False)
+            yaml_dump(payload, datafile, Dumper=dumper_cls, sort_keys=False)
 
 
 if __name__ == "__main__":
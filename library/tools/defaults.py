@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
+import os
+import stat
 
 from library import HADOLINT_CONFIG_PATH, RENOVATE_CONFIG_PATH, TRIVY_CONFIG_PATH
 from library import schema
@@ -81,6 +84,12 @@ DEFAULT_REFURBISH_TOOL: Tool = Tool(
     outputs="/outputs/",
 )
 
+DEFAULT_TOOLS: tuple[Tool, ...] = (
+    DEFAULT_HADOLINT_TOOL,
+    DEFAULT_TRIVY_TOOL,
+    DEFAULT_REFURBISH_TOOL,
+)
+
 DEFAULT_CLI: dict[str, str] = {
     "lint": DEFAULT_HADOLINT_TOOL.id,
     "scan": DEFAULT_TRIVY_TOOL.id,
@@ -89,12 +98,12 @@ DEFAULT_CLI: dict[str, str] = {
 
 
 def default_tools() -> list[Tool]:
-    """Return fresh default runtime tools."""
-    return [
-        DEFAULT_HADOLINT_TOOL.model_copy(deep=True),
-        DEFAULT_TRIVY_TOOL.model_copy(deep=True),
-        DEFAULT_REFURBISH_TOOL.model_copy(deep=True),
-    ]
+    """Return the shared default runtime tools.
+
+    The instances are module-level constants treated as read-only by the
+    runtime; callers that need to mutate one must model_copy it first.
+    """
+    return list(DEFAULT_TOOLS)
 
 
 def default_cli() -> dict[str, str]:
@@ -102,8 +111,13 @@ def default_cli() -> dict[str, str]:
     return dict(DEFAULT_CLI)
 
 
+@lru_cache(maxsize=1)
 def default_config() -> schema.Config:
-    """Return a fresh default runtime config model."""
+    """Return the shared default runtime config model.
+
+    Built once per process; with the tools shared read-only (see
+    default_tools), repeat callers skip the full Config validation walk.
+    """
     return schema.Config(
         policy="default",
         conflicts="warn",
@@ -112,21 +126,48 @@ def default_config() -> schema.Config:
     )
 
 
-DEFAULT_CONFIG: schema.Config = default_config()
-
-
-def _resolve_manifest_dockerfile(path: Path) -> Path:
-    """Resolve Dockerfile host path from manifest build context/file."""
-    manifest = schema.Schema.from_yaml(path)
-    dockerfile = Path(manifest.build.file)
+def manifest_dockerfile(path: Path) -> Path:
+    """Resolve Dockerfile host path from manifest build context/file.
+
+    Reads the cached raw manifest payload and validates only the build
+    section in one pass; full schema validation happens on the dispatch
+    path that loads the manifest model.
+    """
+    location = path if path.is_absolute() else path.expanduser().resolve()
+    data = schema.load_manifest_data(location)
+    build = data.get("build")
+    if not isinstance(build, dict):
+        raise ValueError(f"Manifest build section is invalid: {location}")
+    file_value = build.get("file", "Dockerfile")
+    context_value = build.get("context", ".")
+    if not isinstance(file_value, str) or not isinstance(context_value, str):
+        raise ValueError(f"Manifest build section is invalid: {location}")
+
+    dockerfile = Path(file_value)
     if not dockerfile.is_absolute():
-        dockerfile = path.parent / manifest.build.context / dockerfile
-    dockerfile = dockerfile.resolve()
-    if not dockerfile.is_file():
+        dockerfile = Path(
+            os.path.normpath(location.parent / context_value / dockerfile)
+        )
+    try:
+        stats = os.stat(dockerfile)
+    except OSError as exc:
+        raise ValueError(
+            f"Dockerfile from manifest does not exist: {dockerfile}"
+        ) from exc
+    if not stat.S_ISREG(stats.st_mode):
         raise ValueError(f"Dockerfile from manifest does not exist: {dockerfile}")
     return dockerfile
 
 
+@lru_cache(maxsize=8)
+def _packaged_input_path(key: str) -> Path:
+    """Resolve and stat-check a packaged default input once per process."""
+    default_path = DEFAULT_INPUT_REGISTRY[key]
+    if not default_path.is_file():
+        raise ValueError(f"Packaged default input not found: {default_path}")
+    return default_path.resolve()
+
+
 def input(tool: Tool, input_key: str, manifest: Path | None) -> Path:
     """Resolve packaged default input path for a tool input key."""
     if input_key not in tool.inputs:
@@ -135,15 +176,11 @@ def input(tool: Tool, input_key: str, manifest: Path | None) -> Path:
     if input_key == "dockerfile":
         if manifest is None:
             raise ValueError("Default dockerfile input requires a manifest path.")
-        return _resolve_manifest_dockerfile(manifest)
+        return manifest_dockerfile(manifest)
 
-    default_path = DEFAULT_INPUT_REGISTRY.get(input_key)
-    if default_path is None:
-        default_path = DEFAULT_INPUT_REGISTRY.get(tool.parser)
-    if default_path is None:
+    key = input_key if input_key in DEFAULT_INPUT_REGISTRY else tool.parser
+    if key not in DEFAULT_INPUT_REGISTRY:
         raise ValueError(
             f"No packaged default input available for parser '{tool.parser}'"
         )
-    if not default_path.is_file():
-        raise ValueError(f"Packaged default input not found: {default_path}")
-    return default_path.resolve()
+    return _packaged_input_path(key)
@@ -0,0 +1,93 @@
+"""Native host execution fast path for containerized tools."""
+
+from __future__ import annotations
+
+import os
+import shutil
+import subprocess
+from collections.abc import Sequence
+from functools import lru_cache
+
+from library.schema import Tool
+from library.utils.runtime import ContainerResult
+
+# Parser -> host executable allowed to serve it natively. Shell-wrapped
+# tools (renovate) and socket-mounting tools (trivy) keep their container.
+NATIVE_EXECUTABLES = {"hadolint": "hadolint"}
+
+
+@lru_cache(maxsize=8)
+def _which(executable: str) -> str | None:
+    """Locate a tool executable on PATH, cached per process."""
+    return shutil.which(executable)
+
+
+def available(tool: Tool) -> bool:
+    """Check whether a tool can run natively on the host.
+
+    The fast path is pinned to the bare allow-listed executable for the
+    tool's parser: manifests choose their own argv, and anything looser
+    would let `library lint` execute arbitrary host binaries with
+    manifest-controlled env. Socket-mounting tools and commands touching
+    the container outputs path also stay containerized.
+    """
+    expected = NATIVE_EXECUTABLES.get(tool.parser)
+    if expected is None or tool.socket:
+        return False
+    # Exact bare-name match: no substitute binaries, and no path
+    # separators that could pick up ./hadolint from an untrusted checkout.
+    if not tool.command or tool.command[0] != expected:
+        return False
+    if any("/outputs" in part for part in tool.command):
+        return False
+    return _which(expected) is not None
+
+
+def _native_env(tool: Tool) -> dict[str, str]:
+    """Merge tool env over the process env with host-safety filtering.
+
+    Keys that redirect executable or loader resolution (PATH, LD_*,
+    DYLD_*) are manifest-controlled and must never reach a host process,
+    and values pointing at container-only destinations (input mounts,
+    /outputs) are meaningless outside the container.
+    """
+    container_paths = {config.destination for config in tool.inputs.values()}
+    environment = dict(os.environ)
+    for key, value in tool.env.items():
+        if key == "PATH" or key.startswith(("LD_", "DYLD_")):
+            continue
+        if value in container_paths or value.startswith("/outputs"):
+            continue
+        environment[key] = value
+    return environment
+
+
+def run(command: Sequence[str], *, tool: Tool) -> ContainerResult:
+    """Run a host-rendered tool command and capture its output.
+
+    The executable is the absolute path located on the invoking user's
+    PATH; argv[0] never goes back through the child's (manifest-merged)
+    environment for lookup.
+
+    Args:
+        command: Argv list rendered with host input paths.
+        tool: Tool definition supplying the filtered environment.
+
+    Returns:
+        The execution result in container-result shape.
+    """
+    executable = _which(command[0])
+    if executable is None:  # pragma: no cover - available() gates callers
+        raise ValueError(f"Native executable not found on PATH: {command[0]}")
+    result = subprocess.run(
+        [executable, *command[1:]],
+        capture_output=True,
+        text=True,
+        check=False,
+        env=_native_env(tool),
+    )
+    return ContainerResult(
+        stdout=result.stdout,
+        stderr=result.stderr,
+        exit_code=result.returncode,
+    )
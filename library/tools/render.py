@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Mapping, Sequence
+from pathlib import Path
 import re
 
 from library.schema import ToolInputs
@@ -15,6 +16,7 @@ def _resolve_token(
     *,
     inputs: Mapping[str, ToolInputs],
     image_reference: str,
+    sources: Mapping[str, Path] | None = None,
 ) -> str:
     """Resolve a supported command token to a concrete value."""
     if token_name == "image.reference":
@@ -24,6 +26,13 @@ def _resolve_token(
         tool_input = inputs.get(input_key)
         if tool_input is None:
             raise ValueError(f"Command references undefined input token: {token_name}")
+        if sources is not None:
+            source = sources.get(input_key)
+            if source is None:
+                raise ValueError(
+                    f"Command references unresolved input source: {token_name}"
+                )
+            return str(source)
         return tool_input.destination
     raise ValueError(f"Unsupported command token: {token_name}")
 
@@ -33,8 +42,17 @@ def command(
     *,
     inputs: Mapping[str, ToolInputs],
     image_reference: str,
+    sources: Mapping[str, Path] | None = None,
 ) -> list[str]:
-    """Render supported command tokens in a tokenized argv list."""
+    """Render supported command tokens in a tokenized argv list.
+
+    Args:
+        cmd: Tokenized command template.
+        inputs: Tool input definitions keyed by input name.
+        image_reference: Image reference substituted for {{image.reference}}.
+        sources: Optional host input paths; when provided, input tokens
+            render to these instead of container destinations.
+    """
     rendered: list[str] = []
     for part in cmd:
         matches = TOOL_TOKEN_PATTERN.findall(part)
@@ -47,6 +65,7 @@ def command(
                 token_name,
                 inputs=inputs,
                 image_reference=image_reference,
+                sources=sources,
             )
 
         rendered_part = TOOL_TOKEN_PATTERN.sub(replacer, part)
@@ -6,7 +6,7 @@ from pathlib import Path
 
 from library import schema
 from library.schema import Tool, ToolInputs
-from library.tools import defaults, render, resolve, workspace
+from library.tools import defaults, native, render, resolve, workspace
 from library.tools.models import ToolRunContext, ToolRunResult
 from library.utils import runtime
 
@@ -87,24 +87,44 @@ def run(context: ToolRunContext) -> ToolRunResult:
         tool_id=tool.id,
         run_time=context.time,
     )
-    command = render.command(
-        tool.command,
-        inputs=tool.inputs,
-        image_reference=context.image,
-    )
-    result = runtime.run(
-        tool.image,
-        command,
-        volumes=_build_volumes(
-            manifest=manifest_path,
-            tool=tool,
-            output_dir=output_dir,
-        ),
-        environment=tool.env,
-        verbose=False,
-        emit_output=False,
-        stream_output=False,
-    )
+    if native.available(tool):
+        # The binary is on PATH; render input tokens to host paths and skip
+        # container orchestration entirely.
+        sources = {
+            input_key: _resolve_input_source(
+                manifest=manifest_path,
+                tool=tool,
+                input_key=input_key,
+                input_config=input_config,
+            )
+            for input_key, input_config in tool.inputs.items()
+        }
+        command = render.command(
+            tool.command,
+            inputs=tool.inputs,
+            image_reference=context.image,
+            sources=sources,
+        )
+        result = native.run(command, tool=tool)
+    else:
+        command = render.command(
+            tool.command,
+            inputs=tool.inputs,
+            image_reference=context.image,
+        )
+        result = runtime.run(
+            tool.image,
+            command,
+            volumes=_build_volumes(
+                manifest=manifest_path,
+                tool=tool,
+                output_dir=output_dir,
+            ),
+            environment=tool.env,
+            verbose=False,
+            emit_output=False,
+            stream_output=False,
+        )
 
     if not output_dir.is_dir():
         raise ValueError(f"Tool output directory not found: {output_dir}")
@@ -8,18 +8,34 @@ from pathlib import Path
 RUN_TIME_FORMAT = "%Y%m%dT%H%M%SZ"
 OUTPUT_ROOT_DIRNAME = ".library-tool-outputs"
 
+_UTC = timezone.utc
+
 
 def format(run_time: datetime) -> str:
     """Format run time using UTC basic format."""
     if run_time.tzinfo is None:
-        utc_time = run_time.replace(tzinfo=timezone.utc)
+        utc_time = run_time.replace(tzinfo=_UTC)
     else:
-        utc_time = run_time.astimezone(timezone.utc)
+        utc_time = run_time.astimezone(_UTC)
     return utc_time.strftime(RUN_TIME_FORMAT)
 
 
 def create(root: Path, tool_id: str, run_time: datetime) -> Path:
-    """Create and return deterministic host run directory."""
-    run_dir = root.resolve() / OUTPUT_ROOT_DIRNAME / tool_id / format(run_time)
-    run_dir.mkdir(parents=True, exist_ok=True)
-    return run_dir
+    """Create and return a unique deterministic host run directory.
+
+    Concurrent dispatches can collide on (root, tool id, second-resolution
+    timestamp); the directory is claimed atomically and numbered suffixes
+    keep simultaneous runs from sharing or cross-reading artifacts.
+    """
+    base_dir = root.resolve() / OUTPUT_ROOT_DIRNAME / tool_id
+    stamp = format(run_time)
+    run_dir = base_dir / stamp
+    suffix = 0
+    while True:
+        try:
+            run_dir.mkdir(parents=True)
+        except FileExistsError:
+            suffix += 1
+            run_dir = base_dir / f"{stamp}-{suffix}"
+        else:
+            return run_dir
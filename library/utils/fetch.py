@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import hashlib
+import os
 import posixpath
 import urllib
 import urllib.error
 import urllib.request
+from pathlib import Path
 from urllib.parse import urlparse
 
 from library import ALLOWED_GIT_SOURCES
@@ -110,6 +113,54 @@ def url(repo: str, commit: str, path: str | None, filename: str) -> str:
     raise ValueError("Unsupported git host.")
 
 
+def _blob_cache_path(key: str) -> Path:
+    """Return the on-disk cache path for a commit-pinned blob key."""
+    cache_root = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    return cache_root / "canfar-library" / "blobs" / key
+
+
+def cached_contents(
+    repo: str,
+    commit: str,
+    path: str | None,
+    filename: str,
+    timeout: float = 10.0,
+) -> str:
+    """Fetch a repository file pinned to a commit, caching blobs on disk.
+
+    Commits are immutable, so cached blobs never need invalidation and
+    repeat fetches for the same (repo, commit, path) skip the network.
+
+    Args:
+        repo: Git repository URL.
+        commit: Commit SHA to read from.
+        path: Path to the directory containing the file.
+        filename: File name to fetch.
+        timeout: Timeout in seconds for the HTTP request.
+
+    Returns:
+        Text content from the remote file.
+
+    Raises:
+        ValueError: If the repo host or URL scheme is not supported.
+        RuntimeError: For network errors, HTTP errors, or decode failures.
+    """
+    file_path = _normalize_file_path(path, filename)
+    key = hashlib.sha256(f"{repo}|{commit}|{file_path}".encode()).hexdigest()
+    blob_path = _blob_cache_path(key)
+    try:
+        return blob_path.read_text(encoding="utf-8")
+    except OSError:
+        pass
+    text = contents(url(repo, commit, path, filename), timeout=timeout)
+    try:
+        blob_path.parent.mkdir(parents=True, exist_ok=True)
+        blob_path.write_text(text, encoding="utf-8")
+    except OSError:
+        pass
+    return text
+
+
 def contents(raw_url: str, timeout: float = 10.0) -> str:
     """Fetch raw file contents via HTTP.
 
@@ -6,14 +6,27 @@ from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
 from functools import lru_cache
 import sys
-from typing import Any, cast
+import threading
+from typing import TYPE_CHECKING, Any, cast
 
-import docker as docker_sdk
-from docker.errors import APIError, DockerException, ImageNotFound
+if TYPE_CHECKING:
+    import docker as docker_sdk
 
 from library.utils.console import console
 
 
+@lru_cache(maxsize=1)
+def _sdk_errors() -> Any:
+    """Import Docker SDK error types on first use.
+
+    The SDK drags in requests/urllib3; deferring it keeps module import
+    (and CLI cold start) free of that cost.
+    """
+    from docker import errors
+
+    return errors
+
+
 @dataclass(slots=True)
 class ContainerResult:
     """Container execution result."""
@@ -30,7 +43,9 @@ def get_client() -> docker_sdk.DockerClient:
     Returns:
         DockerClient: Docker SDK client.
     """
-    return docker_sdk.from_env()
+    import docker
+
+    return docker.from_env()
 
 
 def image_exists(image: str) -> bool:
@@ -45,32 +60,55 @@ def image_exists(image: str) -> bool:
     try:
         get_client().images.get(image)
         return True
-    except ImageNotFound:
+    except _sdk_errors().ImageNotFound:
         return False
-    except DockerException as exc:
+    except _sdk_errors().DockerException as exc:
         console.print(f"[red]Docker: Failed to inspect {image}: {exc}[/red]")
         return False
 
 
+_PULLED_DIGESTS: set[str] = set()
+_PULLED_LOCK = threading.Lock()
+
+
+def _is_digest_reference(image: str) -> bool:
+    """Check whether an image reference is pinned by content digest."""
+    return "@sha256:" in image
+
+
 def pull(image: str, *, quiet: bool = False) -> None:
     """Pull a Docker image with follow-along logs.
 
+    Digest-pinned references are immutable, so a pull is skipped when the
+    image was already pulled in this process or is present locally. Tag
+    references are always pulled so moving tags stay fresh.
+
     Args:
         image: Docker image to pull.
         quiet: Whether to suppress output.
     """
+    if _is_digest_reference(image):
+        with _PULLED_LOCK:
+            already_pulled = image in _PULLED_DIGESTS
+        if already_pulled or image_exists(image):
+            with _PULLED_LOCK:
+                _PULLED_DIGESTS.add(image)
+            return
     if not quiet:
         console.print(f"[cyan]Docker: Pulling Image {image}[/cyan]")
     try:
         get_client().images.pull(image)
+        if _is_digest_reference(image):
+            with _PULLED_LOCK:
+                _PULLED_DIGESTS.add(image)
         if not quiet:
             console.print("[cyan]Docker: Pull Complete.[/cyan]")
-    except APIError as exc:
+    except _sdk_errors().APIError as exc:
         if quiet:
             print(str(exc), end="", file=sys.stderr)
         else:
             console.print(f"[red]Docker: Pull failed: {exc}[/red]")
-    except DockerException as exc:
+    except _sdk_errors().DockerException as exc:
         if quiet:
             print(str(exc), end="", file=sys.stderr)
         else:
@@ -111,9 +149,9 @@ def _emit_container_finish(
     """
     if emit_output and not stream_output:
         if stderr:
-            print(stderr, end="", file=sys.stderr)
+            sys.stderr.write(stderr)
         if verbose and stdout:
-            print(stdout, end="")
+            sys.stdout.write(stdout)
         console.print(
             f"[cyan]Docker: Container Finished with exit code {exit_code}.[/cyan]"
         )
@@ -295,7 +333,7 @@ def _remove_container(container: Any) -> None:
     """
     try:
         container.remove(force=True)
-    except DockerException:
+    except _sdk_errors().DockerException:
         pass
 
 
@@ -29,13 +29,15 @@ def test_run_build_expands_plain_manifest_tags(monkeypatch) -> None:
             self.file = "Dockerfile"
             self.output = "type=docker"
 
-        def command(self) -> list[str]:
+        def command(self, extra: tuple[str, ...] = ()) -> list[str]:
             cmd = ["docker", "buildx", "build", "--file", self.file]
             for tag in self.tags:
                 cmd.extend(["--tag", tag])
             for platform in self.platforms:
                 cmd.extend(["--platform", platform])
-            cmd.extend(["--output", self.output, self.context])
+            cmd.extend(["--output", self.output])
+            cmd.extend(extra)
+            cmd.append(self.context)
             return cmd
 
     manifest = SimpleNamespace(
@@ -50,7 +52,7 @@ def test_run_build_expands_plain_manifest_tags(monkeypatch) -> None:
     def fake_from_yaml(_path: Path):
         return manifest
 
-    def fake_run(cmd: list[str], check: bool = False):
+    def fake_run(cmd: list[str], check: bool = False, close_fds: bool = True):
         commands.append(cmd)
         return subprocess.CompletedProcess(args=cmd, returncode=0)
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from pathlib import Path
 
 from typer.testing import CliRunner
@@ -189,3 +190,69 @@ def test_build_positional_manifest_is_rejected(monkeypatch, tmp_path: Path) -> N
     result = runner.invoke(cli, ["build", str(manifest_path)])
 
     assert result.exit_code != 0
+
+
+def test_lint_multiple_manifests_first_failure_wins(
+    monkeypatch, tmp_path: Path
+) -> None:
+    """Repeated --manifest dispatches per manifest and aggregates exit codes."""
+    calls: list[tuple[str, Path]] = []
+
+    def fake_run_tool_command(command, *, manifest, image, verbose):
+        calls.append((command, manifest))
+
+        class _Result:
+            exit_code = 3 if manifest.name.startswith("second") else 0
+
+        class _Dispatched:
+            result = _Result()
+            payload = {}
+
+        return _Dispatched()
+
+    monkeypatch.setattr(cli_main.dispatch, "run_tool_command", fake_run_tool_command)
+    runner = CliRunner()
+    first = tmp_path / "first.manifest.yaml"
+    second = tmp_path / "second.manifest.yaml"
+    first.write_text("version: 1\n", encoding="utf-8")
+    second.write_text("version: 1\n", encoding="utf-8")
+
+    result = runner.invoke(cli, ["lint", "-m", str(first), "-m", str(second)])
+
+    assert result.exit_code == 3
+    # Dispatch order across the worker threads is unordered; coverage is.
+    assert sorted(calls) == [("lint", first), ("lint", second)]
+
+
+def test_refurbish_multiple_manifests_payloads_keep_order(
+    monkeypatch, tmp_path: Path
+) -> None:
+    """--json with several manifests emits payloads in manifest order."""
+
+    def fake_run_tool_command(command, *, manifest, image, verbose):
+        class _Result:
+            exit_code = 0
+
+        class _Dispatched:
+            result = _Result()
+            payload = {"updates": [manifest.stem]}
+
+        return _Dispatched()
+
+    monkeypatch.setattr(cli_main.dispatch, "run_tool_command", fake_run_tool_command)
+    runner = CliRunner()
+    first = tmp_path / "first.manifest.yaml"
+    second = tmp_path / "second.manifest.yaml"
+    first.write_text("version: 1\n", encoding="utf-8")
+    second.write_text("version: 1\n", encoding="utf-8")
+
+    result = runner.invoke(
+        cli, ["refurbish", "--json", "-m", str(first), "-m", str(second)]
+    )
+
+    assert result.exit_code == 0
+    payload = json.loads(result.stdout)
+    assert payload == [
+        {"updates": ["first.manifest"]},
+        {"updates": ["second.manifest"]},
+    ]
@@ -0,0 +1,85 @@
+"""Tests for the on-disk manifest parse cache."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+from library import schema
+
+
+def _load_fresh(path: Path) -> dict[str, object]:
+    """Load manifest data with the in-memory cache cleared."""
+    schema._cached_manifest_data.cache_clear()
+    return schema.load_manifest_data(path)
+
+
+def _cache_files(cache_root: Path) -> list[Path]:
+    """List sidecar cache files under an XDG cache root."""
+    cache_dir = cache_root / "canfar-library"
+    if not cache_dir.is_dir():
+        return []
+    return sorted(cache_dir.glob("*.json"))
+
+
+def test_cache_written_and_preferred_on_reload(tmp_path: Path, monkeypatch) -> None:
+    """A parse writes the sidecar and a later load reads it back."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    manifest = tmp_path / "m.yaml"
+    manifest.write_text("version: 1\n", encoding="utf-8")
+
+    assert _load_fresh(manifest) == {"version": 1}
+    cache_files = _cache_files(tmp_path / "cache")
+    assert len(cache_files) == 1
+
+    # Replace the cached data under a matching stat signature; the next
+    # cold load must come from the sidecar, not a YAML reparse.
+    stats = manifest.stat()
+    cache_files[0].write_text(
+        json.dumps(
+            {
+                "mtime_ns": stats.st_mtime_ns,
+                "size": stats.st_size,
+                "data": {"version": 99},
+            }
+        ),
+        encoding="utf-8",
+    )
+    assert _load_fresh(manifest) == {"version": 99}
+
+
+def test_cache_invalidated_when_manifest_changes(tmp_path: Path, monkeypatch) -> None:
+    """A changed stat signature forces a fresh parse and cache rewrite."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    manifest = tmp_path / "m.yaml"
+    manifest.write_text("version: 1\n", encoding="utf-8")
+    assert _load_fresh(manifest) == {"version": 1}
+
+    manifest.write_text("version: 2\n", encoding="utf-8")
+    # Same byte length; force a distinct mtime_ns so the signature moves.
+    os.utime(manifest, ns=(1, 1))
+    assert _load_fresh(manifest) == {"version": 2}
+
+
+def test_cache_falls_back_on_garbage_content(tmp_path: Path, monkeypatch) -> None:
+    """Corrupt or partial sidecars are ignored in favor of the YAML parse."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    manifest = tmp_path / "m.yaml"
+    manifest.write_text("version: 1\n", encoding="utf-8")
+    assert _load_fresh(manifest) == {"version": 1}
+
+    for cache_file in _cache_files(tmp_path / "cache"):
+        cache_file.write_text("not json", encoding="utf-8")
+    assert _load_fresh(manifest) == {"version": 1}
+
+
+def test_cache_skips_payloads_with_non_string_keys(tmp_path: Path, monkeypatch) -> None:
+    """Non-string YAML keys stay uncached; JSON would stringify them."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    manifest = tmp_path / "m.yaml"
+    manifest.write_text("true: yes\n", encoding="utf-8")
+
+    data = _load_fresh(manifest)
+    assert True in data
+    assert _cache_files(tmp_path / "cache") == []
@@ -70,14 +70,13 @@ def _write_manifest(path: Path, payload: dict[str, object]) -> None:
     path.write_text(safe_dump(payload, sort_keys=False), encoding="utf-8")
 
 
-def test_default_constructors_return_fresh_models() -> None:
-    """Default constructors should return independent runtime models."""
+def test_default_configs_share_readonly_tool_instances() -> None:
+    """Default configs share the module-level read-only tool instances."""
     left = defaults.default_config()
     right = defaults.default_config()
 
-    left.tools[0].image = "docker.io/example/other:1"
-
-    assert right.tools[0].image != "docker.io/example/other:1"
+    assert left.tools[0] is right.tools[0]
+    assert left.tools[0] is defaults.DEFAULT_HADOLINT_TOOL
 
 
 def test_manifest_rejects_missing_config() -> None:
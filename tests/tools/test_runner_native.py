@@ -0,0 +1,192 @@
+"""Tests for the native tool execution fast path."""
+
+from __future__ import annotations
+
+import subprocess
+from datetime import datetime, timezone
+from pathlib import Path
+
+from library import schema
+from library.tools import native, runner
+from library.tools.models import ToolRunContext
+
+
+def _hadolint_tool(dockerfile: Path) -> schema.Tool:
+    return schema.Tool(
+        id="default-linter",
+        parser="hadolint",
+        image="docker.io/hadolint/hadolint:latest",
+        command=["hadolint", "--format", "json", "{{inputs.dockerfile}}"],
+        inputs={
+            "dockerfile": schema.ToolInputs(
+                source=dockerfile, destination="/inputs/Dockerfile"
+            ),
+        },
+        socket=False,
+        outputs="/outputs/",
+    )
+
+
+def test_native_unavailable_for_unsupported_parser(tmp_path: Path, monkeypatch) -> None:
+    """Only allow-listed parsers may run natively."""
+    monkeypatch.setattr(native, "_which", lambda executable: "/usr/bin/sh")
+    dockerfile = tmp_path / "Dockerfile"
+    dockerfile.write_text("FROM alpine:3.20\n", encoding="utf-8")
+
+    tool = _hadolint_tool(dockerfile)
+    renovate = tool.model_copy(update={"parser": "renovate"})
+
+    assert native.available(renovate) is False
+
+
+def test_native_unavailable_without_binary(tmp_path: Path, monkeypatch) -> None:
+    """Missing host binary keeps the container path."""
+    monkeypatch.setattr(native, "_which", lambda executable: None)
+    dockerfile = tmp_path / "Dockerfile"
+    dockerfile.write_text("FROM alpine:3.20\n", encoding="utf-8")
+
+    assert native.available(_hadolint_tool(dockerfile)) is False
+
+
+def test_native_unavailable_when_command_writes_outputs(
+    tmp_path: Path, monkeypatch
+) -> None:
+    """Tools writing into the container outputs path must stay containerized."""
+    monkeypatch.setattr(native, "_which", lambda executable: "/usr/bin/hadolint")
+    dockerfile = tmp_path / "Dockerfile"
+    dockerfile.write_text("FROM alpine:3.20\n", encoding="utf-8")
+
+    tool = _hadolint_tool(dockerfile).model_copy(
+        update={"command": ["hadolint", "-f", "json", "{{inputs.dockerfile}}"]}
+    )
+    tool.command = [*tool.command[:-1], "--output", "/outputs/x.json"]
+
+    assert native.available(tool) is False
+
+
+def test_runner_uses_native_path_when_binary_available(
+    tmp_path: Path, monkeypatch
+) -> None:
+    """Runner renders host paths and skips Docker when the binary exists."""
+    dockerfile = tmp_path / "Dockerfile"
+    dockerfile.write_text("FROM alpine:3.20\n", encoding="utf-8")
+    tool = _hadolint_tool(dockerfile)
+
+    commands: list[list[str]] = []
+
+    def fake_run(command, capture_output, text, check, env):
+        commands.append(list(command))
+        return subprocess.CompletedProcess(
+            args=command, returncode=0, stdout="[]", stderr=""
+        )
+
+    def fail_docker(*_args, **_kwargs):
+        raise AssertionError("Docker runtime must not be used on the native path.")
+
+    monkeypatch.setattr(native, "_which", lambda executable: "/usr/bin/hadolint")
+    monkeypatch.setattr(native.subprocess, "run", fake_run)
+    monkeypatch.setattr(runner.runtime, "run", fail_docker)
+
+    result = runner.run(
+        ToolRunContext(
+            manifest=None,
+            command="lint",
+            image="unused-for-lint",
+            time=datetime(2026, 2, 18, 20, 0, 0, tzinfo=timezone.utc),
+            tool=tool,
+            output_root=tmp_path,
+        )
+    )
+
+    assert result.exit_code == 0
+    assert result.stdout == "[]"
+    # argv[0] is the absolute resolved binary, never the bare name.
+    assert commands == [["/usr/bin/hadolint", "--format", "json", str(dockerfile)]]
+
+
+def test_native_unavailable_for_non_hadolint_argv0(tmp_path: Path, monkeypatch) -> None:
+    """Manifest-chosen executables other than hadolint stay containerized."""
+    monkeypatch.setattr(native, "_which", lambda executable: "/usr/bin/python")
+    dockerfile = tmp_path / "Dockerfile"
+    dockerfile.write_text("FROM alpine:3.20\n", encoding="utf-8")
+
+    tool = _hadolint_tool(dockerfile)
+    tool.command = ["python", "-c", "print('pwned')"]
+
+    assert native.available(tool) is False
+
+
+def test_native_unavailable_for_path_prefixed_argv0(
+    tmp_path: Path, monkeypatch
+) -> None:
+    """A ./hadolint shipped in a checkout must not be picked up."""
+    monkeypatch.setattr(native, "_which", lambda executable: str(tmp_path / "hadolint"))
+    dockerfile = tmp_path / "Dockerfile"
+    dockerfile.write_text("FROM alpine:3.20\n", encoding="utf-8")
+
+    tool = _hadolint_tool(dockerfile)
+    tool.command = ["./hadolint", "--format", "json", "{{inputs.dockerfile}}"]
+
+    assert native.available(tool) is False
+
+
+def test_native_env_filters_resolution_and_container_entries(
+    tmp_path: Path, monkeypatch
+) -> None:
+    """Manifest env must not redirect host lookup or leak container paths."""
+    monkeypatch.setenv("PATH", "/usr/bin")
+    dockerfile = tmp_path / "Dockerfile"
+    dockerfile.write_text("FROM alpine:3.20\n", encoding="utf-8")
+
+    tool = _hadolint_tool(dockerfile).model_copy(
+        update={
+            "env": {
+                "PATH": "/evil",
+                "LD_PRELOAD": "/evil/hook.so",
+                "DYLD_INSERT_LIBRARIES": "/evil/hook.dylib",
+                "HADOLINT_CONFIG": "/inputs/Dockerfile",
+                "HADOLINT_OUT": "/outputs/report.json",
+                "HADOLINT_VERBOSE": "1",
+            }
+        }
+    )
+
+    environment = native._native_env(tool)
+
+    assert environment["PATH"] == "/usr/bin"
+    assert "LD_PRELOAD" not in environment
+    assert "DYLD_INSERT_LIBRARIES" not in environment
+    assert "HADOLINT_CONFIG" not in environment
+    assert "HADOLINT_OUT" not in environment
+    assert environment["HADOLINT_VERBOSE"] == "1"
+
+
+def test_native_run_executes_resolved_absolute_path(
+    tmp_path: Path, monkeypatch
+) -> None:
+    """run() execs the which-resolved binary, not the bare argv[0]."""
+    dockerfile = tmp_path / "Dockerfile"
+    dockerfile.write_text("FROM alpine:3.20\n", encoding="utf-8")
+    tool = _hadolint_tool(dockerfile)
+
+    captured: dict[str, object] = {}
+
+    def fake_run(command, capture_output, text, check, env):
+        captured["command"] = list(command)
+        captured["env"] = env
+        return subprocess.CompletedProcess(
+            args=command, returncode=0, stdout="[]", stderr=""
+        )
+
+    monkeypatch.setattr(native, "_which", lambda executable: "/opt/bin/hadolint")
+    monkeypatch.setattr(native.subprocess, "run", fake_run)
+
+    result = native.run(["hadolint", "--format", "json", str(dockerfile)], tool=tool)
+
+    assert result.exit_code == 0
+    assert captured["command"] == [
+        "/opt/bin/hadolint",
+        "--format",
+        "json",
+        str(dockerfile),
+    ]
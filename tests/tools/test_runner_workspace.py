@@ -24,3 +24,23 @@ def test_workspace_path_shape_and_time_format(tmp_path) -> None:
         == tmp_path / ".library-tool-outputs" / "default-scanner" / "20260218T192021Z"
     )
     assert run_dir.is_dir()
+
+
+def test_workspace_collisions_get_unique_suffixes(tmp_path) -> None:
+    """Runs colliding on tool id and timestamp must not share a directory."""
+    run_time = datetime(2026, 2, 18, 19, 20, 21, tzinfo=timezone.utc)
+
+    first = workspace.create(
+        root=tmp_path, tool_id="default-scanner", run_time=run_time
+    )
+    second = workspace.create(
+        root=tmp_path, tool_id="default-scanner", run_time=run_time
+    )
+    third = workspace.create(
+        root=tmp_path, tool_id="default-scanner", run_time=run_time
+    )
+
+    assert len({first, second, third}) == 3
+    assert second.name == "20260218T192021Z-1"
+    assert third.name == "20260218T192021Z-2"
+    assert second.is_dir() and third.is_dir()
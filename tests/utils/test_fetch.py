@@ -94,3 +94,25 @@ def test_fetch_contents_raises_on_request_error(monkeypatch) -> None:
     monkeypatch.setattr(fetch.urllib.request, "urlopen", raise_error)
     with pytest.raises(RuntimeError, match="Failed to fetch URL"):
         fetch.contents("https://x")
+
+
+def test_cached_contents_skips_network_on_repeat(monkeypatch, tmp_path) -> None:
+    """Fetch commit-pinned blobs from disk cache after the first call."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    calls: list[str] = []
+
+    def fake_urlopen(raw_url, *_args, **_kwargs):
+        calls.append(raw_url)
+        return DummyResponse(200, b"FROM scratch")
+
+    monkeypatch.setattr(fetch.urllib.request, "urlopen", fake_urlopen)
+
+    first = fetch.cached_contents(
+        "https://github.com/opencadc/canfar-library", "abc123", ".", "Dockerfile"
+    )
+    second = fetch.cached_contents(
+        "https://github.com/opencadc/canfar-library", "abc123", ".", "Dockerfile"
+    )
+
+    assert first == second == "FROM scratch"
+    assert len(calls) == 1